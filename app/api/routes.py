@@ -1,15 +1,30 @@
-from fastapi import APIRouter, HTTPException, BackgroundTasks
+import asyncio
+from typing import Dict, Set, Tuple
+
+import orjson
+from fastapi import APIRouter, HTTPException, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from typing import Dict, Optional
+from app.core.config import get_settings
 from app.services.analyzer import WebsiteAnalyzer
-from app.models.schemas import AnalysisResult
+from app.services.results import get_result_store
+from app.models.schemas import AnalysisResult, AnalysisStatus
 import uuid
 
 router = APIRouter()
 analyzer = WebsiteAnalyzer()
 
-# In-memory storage for analysis results
-analysis_results: Dict[str, Optional[AnalysisResult]] = {}
+# Pending and finished analyses (in-process, or Redis when configured)
+analysis_results = get_result_store()
+
+# Caps how many analyses share this worker's event loop; the rest wait their turn
+_analysis_slots = asyncio.Semaphore(get_settings().max_concurrent_analyses)
+
+# Strong references so running analyses aren't garbage-collected
+_running_analyses: Set[asyncio.Task] = set()
+
+# Queued/running analysis ids by (url, desktop, mobile); identical POSTs share one run
+_inflight: Dict[Tuple[str, bool, bool], str] = {}
 
 
 class AnalyzeRequest(BaseModel):
@@ -20,45 +35,61 @@ class AnalyzeRequest(BaseModel):
 
 async def run_analysis(analysis_id: str, url: str, analyze_desktop: bool, analyze_mobile: bool):
     """Background task to run the analysis"""
-    try:
-        result = await analyzer.analyze(
-            url=url,
-            analyze_desktop=analyze_desktop,
-            analyze_mobile=analyze_mobile
-        )
-        analysis_results[analysis_id] = result
-    except Exception as e:
-        # Store error result
-        from datetime import datetime
-        from app.models.schemas import AnalysisStatus
-        analysis_results[analysis_id] = AnalysisResult(
-            id=analysis_id,
-            url=url,
-            status=AnalysisStatus.FAILED,
-            timestamp=datetime.utcnow(),
-            error_message=str(e)
-        )
+    async with _analysis_slots:
+        try:
+            result = await analyzer.analyze(
+                url=url,
+                analyze_desktop=analyze_desktop,
+                analyze_mobile=analyze_mobile
+            )
+            await analysis_results.save(analysis_id, result)
+        except Exception as e:
+            # Store error result
+            from datetime import datetime
+            from app.models.schemas import AnalysisStatus
+            await analysis_results.save(analysis_id, AnalysisResult.model_construct(
+                id=analysis_id,
+                url=url,
+                status=AnalysisStatus.FAILED,
+                timestamp=datetime.utcnow(),
+                error_message=str(e)
+            ))
 
 
 @router.post("/analyze")
-async def analyze_website(payload: AnalyzeRequest, background_tasks: BackgroundTasks):
+async def analyze_website(payload: AnalyzeRequest):
     """
     Start website analysis and return analysis ID
     """
     if not payload.url:
         raise HTTPException(status_code=400, detail="URL is required")
     
+    key = (payload.url, payload.analyze_desktop, payload.analyze_mobile)
+    existing_id = _inflight.get(key)
+    if existing_id is not None:
+        return {"analysis_id": existing_id}
+
     analysis_id = str(uuid.uuid4())
-    analysis_results[analysis_id] = None  # Mark as pending
-    
-    # Run analysis in background
-    background_tasks.add_task(
-        run_analysis,
-        analysis_id,
-        payload.url,
-        payload.analyze_desktop,
-        payload.analyze_mobile
-    )
+    # Registered before the first await so concurrent identical POSTs share it;
+    # released again if the analysis never gets started
+    _inflight[key] = analysis_id
+    try:
+        await analysis_results.mark_pending(analysis_id)
+
+        # Run analysis in background
+        task = asyncio.create_task(run_analysis(
+            analysis_id,
+            payload.url,
+            payload.analyze_desktop,
+            payload.analyze_mobile
+        ))
+    except BaseException:
+        _inflight.pop(key, None)
+        raise
+
+    _running_analyses.add(task)
+    task.add_done_callback(_running_analyses.discard)
+    task.add_done_callback(lambda _: _inflight.pop(key, None))
     
     return {"analysis_id": analysis_id}
 
@@ -68,13 +99,51 @@ async def get_analysis_result(analysis_id: str):
     """
     Get analysis result by ID
     """
-    if analysis_id not in analysis_results:
+    try:
+        result = await analysis_results.get(analysis_id)
+    except KeyError:
         raise HTTPException(status_code=404, detail="Analysis not found")
-    
-    result = analysis_results[analysis_id]
-    
+
     if result is None:
         # Analysis is still pending
         return {"status": "pending", "analysis_id": analysis_id}
-    
-    return result
\ No newline at end of file
+
+    # Already JSON-encoded when the analysis finished
+    return Response(content=result, media_type="application/json")
+
+
+@router.get("/analyze/{analysis_id}/insights/stream")
+async def stream_analysis_insights(analysis_id: str):
+    """
+    Stream AI insights for a completed analysis as NDJSON,
+    one {"delta": "..."} line per chunk of model output
+    """
+    try:
+        result = await analysis_results.get(analysis_id)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Analysis not found")
+
+    if result is None:
+        raise HTTPException(status_code=409, detail="Analysis is still pending")
+
+    data = orjson.loads(result)
+    if data.get("status") != AnalysisStatus.COMPLETED.value:
+        raise HTTPException(status_code=409, detail="Analysis did not complete")
+
+    desktop = data.get("desktop")
+    mobile = data.get("mobile")
+
+    async def ndjson_lines():
+        try:
+            async for delta in analyzer.gemini.stream_insights(
+                url=data["url"],
+                overall_score=data.get("overall_score") or 0,
+                desktop_score=desktop["performance"]["score"] if desktop else None,
+                mobile_score=mobile["performance"]["score"] if mobile else None,
+            ):
+                yield orjson.dumps({"delta": delta}) + b"\n"
+        except Exception as exc:
+            # Headers are already sent, so report the failure in-band
+            yield orjson.dumps({"error": str(exc)}) + b"\n"
+
+    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
@@ -0,0 +1,95 @@
+"""
+In-process caching primitives.
+Bounded, TTL-aware storage so long-running workers don't grow without limit.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Awaitable, Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+_MISSING = object()
+
+
+class TTLCache(Generic[K, V]):
+    """
+    LRU cache with a capacity bound and per-entry expiry.
+
+    - ttl: maximum lifetime of an entry, measured from when it was set
+    - tti: optional idle timeout, measured from the last read or write
+    Expired entries are dropped lazily on access.
+    """
+
+    def __init__(self, capacity: int, ttl: float, tti: Optional[float] = None) -> None:
+        self.capacity = capacity
+        self.ttl = ttl
+        self.tti = tti
+        self._data: "OrderedDict[K, Tuple[float, float, V]]" = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: K, default: Any = None) -> Any:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING:
+                return default
+
+            created, _, value = entry
+            if self._is_expired(entry, now):
+                del self._data[key]
+                return default
+
+            self._data[key] = (created, now, value)
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: K, value: V) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self._data[key] = (now, now, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.capacity:
+                self._data.popitem(last=False)
+
+    def pop(self, key: K, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.pop(key, _MISSING)
+        if entry is _MISSING or self._is_expired(entry, time.monotonic()):
+            return default
+        return entry[2]
+
+    def __contains__(self, key: object) -> bool:
+        return self.get(key, _MISSING) is not _MISSING  # type: ignore[arg-type]
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def _is_expired(self, entry: Tuple[float, float, V], now: float) -> bool:
+        created, accessed, _ = entry
+        if now - created > self.ttl:
+            return True
+        return self.tti is not None and now - accessed > self.tti
+
+
+class SingleFlight(Generic[K, V]):
+    """
+    Collapse concurrent calls for the same key onto one in-flight task.
+    Late callers await the running task instead of starting their own;
+    the key is released as soon as the task finishes.
+    """
+
+    def __init__(self) -> None:
+        self._tasks: Dict[K, "asyncio.Future[V]"] = {}
+
+    async def run(self, key: K, factory: Callable[[], Awaitable[V]]) -> V:
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._tasks[key] = task
+            task.add_done_callback(lambda _: self._tasks.pop(key, None))
+        # Shielded so one caller being cancelled doesn't cancel the others
+        return await asyncio.shield(task)
@@ -24,6 +24,17 @@ class Settings(BaseSettings):
 
     # HTTP
     request_timeout: float = 30.0
+    max_html_bytes: int = 5_000_000
+
+    # CPU-bound analysis (defaults to one process per core; 0 uses a thread instead)
+    cpu_pool_workers: Optional[int] = Field(default=None)
+
+    # Analyses running at once per worker; the rest queue
+    max_concurrent_analyses: int = 8
+
+    # Result storage (REDIS_URL shares results between workers)
+    redis_url: Optional[str] = Field(default=None)
+    result_ttl: float = 3600.0
 
     model_config = SettingsConfigDict(
         env_file=".env",
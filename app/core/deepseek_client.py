@@ -1,20 +1,40 @@
+from typing import Optional
+
 import httpx
 from app.core.config import get_settings
+from app.core.http_client import build_transport
 
-settings = get_settings()
-
-if not settings.gemini_api_key:
-    raise RuntimeError("❌ DeepSeek API key missing")
-
-DEEPSEEK_API_KEY = settings.gemini_api_key.strip()
 DEEPSEEK_API_URL = "https://api.deepseek.com/v1/chat/completions"
 
+_client: Optional[httpx.AsyncClient] = None
+
 
 async def get_client() -> httpx.AsyncClient:
-    return httpx.AsyncClient(
-        timeout=45.0,
-        headers={
-            "Authorization": f"Bearer {DEEPSEEK_API_KEY}",
-            "Content-Type": "application/json",
-        },
-    )
+    """
+    Long-lived client so every LLM call reuses the same TLS connection.
+    Created on first use; closed by the FastAPI lifespan on shutdown.
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        settings = get_settings()
+        if not settings.gemini_api_key:
+            raise RuntimeError("❌ DeepSeek API key missing")
+
+        _client = httpx.AsyncClient(
+            timeout=45.0,
+            headers={
+                "Authorization": f"Bearer {settings.gemini_api_key.strip()}",
+                "Content-Type": "application/json",
+            },
+            transport=build_transport(
+                httpx.Limits(max_keepalive_connections=10, keepalive_expiry=60.0)
+            ),
+        )
+    return _client
+
+
+async def close_client() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
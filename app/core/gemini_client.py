@@ -1,11 +1,19 @@
+from functools import lru_cache
+
 from app.core.config import get_settings
 from google import genai
 
-settings = get_settings()
+GEMINI_MODEL = "gemini-2.5-flash"
+
 
-if not settings.gemini_api_key:
-    raise RuntimeError("GEMINI_API_KEY is missing from configuration")
+@lru_cache
+def get_genai_client() -> genai.Client:
+    """
+    Gemini client, created on first use so importing this module
+    never requires an API key.
+    """
+    settings = get_settings()
+    if not settings.gemini_api_key:
+        raise RuntimeError("GEMINI_API_KEY is missing from configuration")
 
-client = genai.Client(
-    api_key=settings.gemini_api_key
-)
+    return genai.Client(api_key=settings.gemini_api_key)
@@ -0,0 +1,55 @@
+"""
+Shared outbound HTTP client.
+One pooled httpx.AsyncClient per process so keep-alive connections are reused.
+"""
+
+from typing import Optional
+
+import httpx
+
+from app.core.config import get_settings
+
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def build_transport(limits: httpx.Limits) -> httpx.AsyncHTTPTransport:
+    """
+    Transport shared by all outbound clients.
+    HTTP/2 when the optional h2 package is installed (multiplexes concurrent
+    calls to the same host over one connection); one retry on connect errors.
+    """
+    return httpx.AsyncHTTPTransport(http2=HTTP2_AVAILABLE, retries=1, limits=limits)
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Lazily create the process-wide client.
+    Opened on startup by the FastAPI lifespan, closed on shutdown.
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=get_settings().request_timeout,
+            transport=build_transport(
+                httpx.Limits(
+                    max_keepalive_connections=50,
+                    max_connections=100,
+                    keepalive_expiry=30.0,
+                )
+            ),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
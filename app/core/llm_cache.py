@@ -0,0 +1,32 @@
+"""
+LLM response cache.
+Exact-match cache keyed by a SHA-256 of the model and the prompt inputs,
+so repeat analyses of the same site skip the LLM round-trip.
+"""
+
+import hashlib
+from typing import Any, Dict, Optional
+
+import orjson
+
+from app.core.cache import TTLCache
+
+
+class LLMCache:
+    def __init__(self, capacity: int = 1024, ttl: float = 3600.0) -> None:
+        self._cache: TTLCache[str, Dict[str, Any]] = TTLCache(capacity=capacity, ttl=ttl)
+
+    @staticmethod
+    def cache_key(model: str, url: str, metrics: Dict[str, Any]) -> str:
+        """
+        Stable key for a prompt. Callers round noisy numeric inputs
+        beforehand so that small jitter still maps to the same entry.
+        """
+        payload = {"model": model, "url": url, "metrics": metrics}
+        return hashlib.sha256(orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        return self._cache.get(key)
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        self._cache.set(key, value)
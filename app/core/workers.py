@@ -0,0 +1,46 @@
+"""
+Process pool for CPU-bound work.
+Keeps HTML parsing and text analysis off the asyncio event loop.
+"""
+
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+from app.core.config import get_settings
+
+T = TypeVar("T")
+
+_cpu_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_cpu_pool() -> Optional[ProcessPoolExecutor]:
+    """
+    Lazily create the process-wide pool, or None when CPU_POOL_WORKERS=0.
+    Started by the FastAPI lifespan, shut down with it.
+    """
+    global _cpu_pool
+    workers = get_settings().cpu_pool_workers
+    if _cpu_pool is None and workers != 0:
+        _cpu_pool = ProcessPoolExecutor(max_workers=workers or os.cpu_count())
+    return _cpu_pool
+
+
+async def run_cpu_bound(func: Callable[..., T], *args: Any) -> T:
+    """
+    Run func in the process pool, or on a worker thread when the pool is
+    disabled. A thread still frees the event loop but shares the GIL with it,
+    so it suits small containers where a pool per worker costs too much memory.
+    """
+    pool = get_cpu_pool()
+    if pool is None:
+        return await asyncio.to_thread(func, *args)
+    return await asyncio.get_running_loop().run_in_executor(pool, func, *args)
+
+
+def shutdown_cpu_pool() -> None:
+    global _cpu_pool
+    if _cpu_pool is not None:
+        _cpu_pool.shutdown(wait=False, cancel_futures=True)
+        _cpu_pool = None
@@ -1,12 +1,32 @@
+from contextlib import asynccontextmanager
 from pathlib import Path
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 
+from app.api.routes import analyzer
 from app.api.routes import router as api_router
+from app.core.deepseek_client import close_client as close_deepseek_client
+from app.core.http_client import close_http_client, get_http_client
 from app.core.logging import setup_logging
+from app.core.workers import get_cpu_pool, shutdown_cpu_pool
+from app.services.results import get_result_store
 
 BASE_DIR = Path(__file__).resolve().parent
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Shared outbound HTTP pool and CPU worker pool for the lifetime of the process
+    get_http_client()
+    get_cpu_pool()
+    yield
+    shutdown_cpu_pool()
+    await analyzer.aclose()
+    await close_http_client()
+    await close_deepseek_client()
+    await get_result_store().close()
+
+
 def create_app() -> FastAPI:
     setup_logging()
 
@@ -14,6 +34,7 @@ def create_app() -> FastAPI:
         title="Website Analyzer API",
         description="Analyze website performance, SEO, content quality, and AI insights",
         version="1.0.0",
+        lifespan=lifespan,
     )
 
     # 1️⃣ API routes FIRST
@@ -5,58 +5,93 @@ This service coordinates all lower-level services and utilities.
 
 import uuid
 from datetime import datetime
+from typing import Optional, Tuple
 import httpx
 import asyncio
 
+from app.core.cache import TTLCache
+from app.core.config import get_settings
+from app.core.http_client import get_http_client
 from app.core.logging import get_logger
+from app.core.workers import run_cpu_bound
 from app.models.schemas import (
     AnalysisResult,
     AnalysisStatus,
+    ContentAnalysis,
     DeviceAnalysis,
     DeviceType,
+    PerformanceMetrics,
+    SEOAnalysis,
 )
 from app.services.pagespeed import PageSpeedService
-from app.services.gemini import GeminiAnalyzer
+from app.services.gemini import BatchedGeminiAnalyzer
 #from app.services.deepseek import DeepSeekAnalyzer
-from app.utils.seo import analyze_seo
-from app.utils.content import analyze_content
+from app.utils._cache import html_digest
+from app.utils.page import analyze_page
 
 logger = get_logger(__name__)
 
+# Only pages up to this size are kept for conditional revalidation; larger ones
+# are simply re-downloaded. With 64 entries that caps the cache at 16 MB of
+# downloaded HTML per process.
+_HTML_CACHE_MAX_PAGE_BYTES = 256 * 1024
+
 
 class WebsiteAnalyzer:
-    def __init__(self) -> None:
+    def __init__(self, client: Optional[httpx.AsyncClient] = None) -> None:
+        # Falls back to the process-wide pooled client when none is injected
+        self._client = client
+        # SEO/content results keyed by (url, html digest); pure functions of both
+        self._page_cache: TTLCache[Tuple[str, bytes], Tuple[SEOAnalysis, ContentAnalysis]] = TTLCache(
+            capacity=256,
+            ttl=3600.0,
+        )
+        # Last fetched HTML per URL with its validators: (etag, last_modified, html)
+        self._html_cache: TTLCache[str, Tuple[Optional[str], Optional[str], str]] = TTLCache(
+            capacity=64,
+            ttl=3600.0,
+        )
         self.pagespeed = PageSpeedService()
         #self.gemini = DeepSeekAnalyzer()
-        self.gemini = GeminiAnalyzer()
+        # Concurrent analyses share LLM calls; a lone request is sent right away
+        self.gemini = BatchedGeminiAnalyzer(max_batch_size=8, batch_wait_timeout=0.1)
 
     async def analyze(self, url: str, analyze_desktop: bool, analyze_mobile: bool) -> AnalysisResult:
         analysis_id = str(uuid.uuid4())
         logger.info(f"🚀 Starting analysis {analysis_id} for {url}")
 
         try:
-            # Fetch HTML
-            logger.info(f"📄 Fetching HTML from {url}")
-            html = await self._fetch_html(url)
-            logger.info(f"✅ HTML fetched successfully ({len(html)} bytes)")
+            devices = []
+            if analyze_desktop:
+                devices.append(DeviceType.DESKTOP)
+            if analyze_mobile:
+                devices.append(DeviceType.MOBILE)
+
+            # Fetch + analyze the HTML and run PageSpeed for every device concurrently.
+            # PageSpeed works from the URL alone, so it doesn't wait on the HTML.
+            logger.info(f"⚡ Running PageSpeed for {len(devices)} device(s)")
+            results = await asyncio.gather(
+                self._analyze_page(url),
+                *(self.pagespeed.analyze(url, device) for device in devices),
+                return_exceptions=True,
+            )
+            for outcome in results:
+                if isinstance(outcome, BaseException):
+                    raise outcome
 
-            desktop = None
-            mobile = None
-            scores = []
+            # SEO and content don't depend on the device, so both devices share them
+            (seo, content), *performances = results
 
-            # Analyze desktop
-            if analyze_desktop:
-                logger.info("🖥️ Starting desktop analysis")
-                desktop = await self._analyze_device(url, html, DeviceType.DESKTOP)
-                scores.append(desktop.performance.score)
-                logger.info(f"✅ Desktop analysis complete (score: {desktop.performance.score})")
+            analyses = {
+                device: self._analyze_device(device, performance, seo, content)
+                for device, performance in zip(devices, performances)
+            }
+            for device, analysis in analyses.items():
+                logger.info(f"✅ {device.value.capitalize()} analysis complete (score: {analysis.performance.score})")
 
-            # Analyze mobile
-            if analyze_mobile:
-                logger.info("📱 Starting mobile analysis")
-                mobile = await self._analyze_device(url, html, DeviceType.MOBILE)
-                scores.append(mobile.performance.score)
-                logger.info(f"✅ Mobile analysis complete (score: {mobile.performance.score})")
+            desktop = analyses.get(DeviceType.DESKTOP)
+            mobile = analyses.get(DeviceType.MOBILE)
+            scores = [analysis.performance.score for analysis in analyses.values()]
 
             # Calculate overall score
             overall_score = round(sum(scores) / len(scores), 1) if scores else None
@@ -78,7 +113,7 @@ class WebsiteAnalyzer:
             except asyncio.TimeoutError:
                 logger.error("⏱️ AI insights generation timed out, using fallback")
                 from app.models.schemas import AIInsights
-                ai_insights = AIInsights(
+                ai_insights = AIInsights.model_construct(
                     summary=f"Website scored {overall_score}/100. Analysis timed out.",
                     strengths=["Performance and SEO metrics collected"],
                     weaknesses=["AI analysis timed out"],
@@ -88,7 +123,7 @@ class WebsiteAnalyzer:
             except Exception as exc:
                 logger.error(f"❌ AI insights generation failed: {exc}", exc_info=True)
                 from app.models.schemas import AIInsights
-                ai_insights = AIInsights(
+                ai_insights = AIInsights.model_construct(
                     summary=f"Website scored {overall_score}/100. AI insights unavailable.",
                     strengths=["Performance and SEO metrics collected"],
                     weaknesses=["AI analysis failed"],
@@ -98,7 +133,7 @@ class WebsiteAnalyzer:
 
             logger.info(f"✅ Analysis {analysis_id} completed successfully")
 
-            return AnalysisResult(
+            return AnalysisResult.model_construct(
                 id=analysis_id,
                 url=url,
                 status=AnalysisStatus.COMPLETED,
@@ -111,7 +146,7 @@ class WebsiteAnalyzer:
 
         except Exception as exc:
             logger.exception(f"❌ Analysis {analysis_id} failed")
-            return AnalysisResult(
+            return AnalysisResult.model_construct(
                 id=analysis_id,
                 url=url,
                 status=AnalysisStatus.FAILED,
@@ -119,29 +154,86 @@ class WebsiteAnalyzer:
                 error_message=str(exc),
             )
 
+    async def aclose(self) -> None:
+        await self.pagespeed.aclose()
+        await self.gemini.aclose()
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
+    @property
+    def client(self) -> httpx.AsyncClient:
+        return self._client or get_http_client()
+
     async def _fetch_html(self, url: str) -> str:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(url)
+        # Stream with a size cap so a huge page can't balloon memory or stall parsing
+        max_bytes = get_settings().max_html_bytes
+
+        # Revalidate a previously fetched copy instead of downloading it again
+        headers = {}
+        cached = self._html_cache.get(url)
+        if cached is not None:
+            etag, last_modified, _ = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+        async with self.client.stream("GET", url, headers=headers) as response:
+            if response.status_code == 304 and cached is not None:
+                logger.info("♻️ Page not modified, reusing cached HTML")
+                return cached[2]
+
             response.raise_for_status()
-            return response.text
 
-    async def _analyze_device(self, url: str, html: str, device: DeviceType) -> DeviceAnalysis:
+            declared = response.headers.get("Content-Length")
+            if declared and declared.isdigit() and int(declared) > max_bytes:
+                raise ValueError(f"Page too large ({declared} bytes, limit {max_bytes})")
+
+            buffer = bytearray()
+            async for chunk in response.aiter_bytes(64 * 1024):
+                buffer.extend(chunk)
+                if len(buffer) > max_bytes:
+                    raise ValueError(f"Page too large (over {max_bytes} bytes)")
+
+            html = buffer.decode(response.encoding or "utf-8", errors="replace")
+
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            if (etag or last_modified) and len(buffer) <= _HTML_CACHE_MAX_PAGE_BYTES:
+                self._html_cache.set(url, (etag, last_modified, html))
+            else:
+                self._html_cache.pop(url)
+
+            return html
+
+    async def _analyze_page(self, url: str) -> Tuple[SEOAnalysis, ContentAnalysis]:
+        logger.info(f"📄 Fetching HTML from {url}")
+        html = await self._fetch_html(url)
+        logger.info(f"✅ HTML fetched successfully ({len(html)} bytes)")
+
+        key = (url, html_digest(html))
+        cached = self._page_cache.get(key)
+        if cached is not None:
+            logger.info("♻️ Page unchanged since last analysis, reusing SEO/content results")
+            return cached
+
+        # HTML parsing and text analysis are CPU-bound; keep them off the event loop
+        page = await run_cpu_bound(analyze_page, html, url)
+        self._page_cache.set(key, page)
+        return page
+
+    def _analyze_device(
+        self,
+        device: DeviceType,
+        performance: PerformanceMetrics,
+        seo: SEOAnalysis,
+        content: ContentAnalysis,
+    ) -> DeviceAnalysis:
         logger.info(f"Analyzing {device.value} device")
-        
-        # Run performance analysis
-        performance = await self.pagespeed.analyze(url, device)
-        
-        # Run SEO analysis
-        seo = analyze_seo(html, url)
-        
-        # Run content analysis
-        content = analyze_content(html, url)
-
-        return DeviceAnalysis(
+
+        return DeviceAnalysis.model_construct(
             device_type=device,
             performance=performance,
             seo=seo,
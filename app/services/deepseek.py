@@ -4,7 +4,7 @@ from typing import Optional
 from fastapi.concurrency import run_in_threadpool
 
 from app.core.logging import get_logger
-from app.core.deepseek_client import get_deepseek_client, DEEPSEEK_API_URL
+from app.core.deepseek_client import get_client, DEEPSEEK_API_URL
 from app.models.schemas import DeviceAnalysis, AIInsights
 
 logger = get_logger(__name__)
@@ -40,22 +40,24 @@ class DeepSeekAnalyzer:
                 },
             ],
             "temperature": 0.3,
+            "response_format": {"type": "json_object"},
+            "max_tokens": 600,
         }
 
         try:
-            async with get_deepseek_client() as client:
-                logger.info("📤 Sending request to DeepSeek")
+            client = await get_client()
+            logger.info("📤 Sending request to DeepSeek")
 
-                response = await client.post(DEEPSEEK_API_URL, json=payload)
-                response.raise_for_status()
+            response = await client.post(DEEPSEEK_API_URL, json=payload)
+            response.raise_for_status()
 
-                data = response.json()
-                content = data["choices"][0]["message"]["content"].strip()
+            data = response.json()
+            content = data["choices"][0]["message"]["content"].strip()
 
-                logger.info("📥 DeepSeek response received")
+            logger.info("📥 DeepSeek response received")
 
-                parsed = json.loads(content)
-                return AIInsights(**parsed)
+            parsed = json.loads(content)
+            return AIInsights(**parsed)
 
         except Exception as exc:
             logger.error(f"❌ DeepSeek failed: {exc}", exc_info=True)
@@ -64,7 +66,7 @@ class DeepSeekAnalyzer:
     # -------------------------------------------------
 
     def _fallback_insights(self, overall_score: float) -> AIInsights:
-        return AIInsights(
+        return AIInsights.model_construct(
             summary=f"Website scored {overall_score}/100. AI unavailable.",
             strengths=["Performance data collected"],
             weaknesses=["AI analysis failed"],
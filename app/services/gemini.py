@@ -1,13 +1,57 @@
-import json
+import asyncio
 import re
-from typing import Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple
 
+import orjson
+from fastapi.concurrency import run_in_threadpool
+
+from app.core.llm_cache import LLMCache
 from app.core.logging import get_logger
 from app.core.deepseek_client import get_client, DEEPSEEK_API_URL
 from app.models.schemas import DeviceAnalysis, AIInsights
 
 logger = get_logger(__name__)
 
+_JSON_RE = re.compile(r"\{.*\}", re.DOTALL)
+
+# Responses above this size are parsed off the event loop
+_THREADPOOL_PARSE_THRESHOLD = 64 * 1024
+
+# Fixed prompt text, filled with format_map so equal inputs give byte-identical prompts
+_PROMPT_TEMPLATE = """
+Website metrics: {metrics}
+
+Return ONLY valid JSON in this format:
+
+{{
+  "summary": "...",
+  "strengths": ["..."],
+  "weaknesses": ["..."],
+  "quick_wins": ["..."],
+  "strategic_recommendations": "..."
+}}
+"""
+
+_BATCH_PROMPT_TEMPLATE = """
+Metrics for several websites: {sites}
+
+Analyze each website independently. Return ONLY valid JSON in this format,
+with exactly one entry per website and its "id" copied from the input:
+
+{{
+  "results": [
+    {{
+      "id": 0,
+      "summary": "...",
+      "strengths": ["..."],
+      "weaknesses": ["..."],
+      "quick_wins": ["..."],
+      "strategic_recommendations": "..."
+    }}
+  ]
+}}
+"""
+
 
 class GeminiAnalyzer:
     """
@@ -17,18 +61,26 @@ class GeminiAnalyzer:
 
     def __init__(self) -> None:
         self.model = "deepseek-chat"
+        # The prompt only depends on url + scores, so identical inputs reuse the answer
+        self._cache = LLMCache(capacity=2048, ttl=3600.0)
         logger.info("🧠 GeminiAnalyzer (DeepSeek backend) initialized")
 
     def _extract_json(self, text: str) -> dict:
         """
         Extract first valid JSON object from LLM output.
-        Handles markdown, prose, and formatting noise.
+        JSON mode normally returns a bare object; markdown, prose and
+        formatting noise are still handled as a fallback.
         """
-        match = re.search(r"\{.*\}", text, re.DOTALL)
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+
+        match = _JSON_RE.search(text)
         if not match:
             raise ValueError("No JSON object found in AI response")
 
-        return json.loads(match.group())
+        return orjson.loads(match.group())
 
     async def generate_insights(
         self,
@@ -38,7 +90,99 @@ class GeminiAnalyzer:
         overall_score: float,
     ) -> AIInsights:
 
-        payload = {
+        # Rounded to the 0.1 precision PageSpeed reports so equivalent inputs share a key
+        desktop_score = round(desktop.performance.score, 1) if desktop else None
+        mobile_score = round(mobile.performance.score, 1) if mobile else None
+        overall_score = round(overall_score, 1)
+
+        key = self._cache_key(url, overall_score, desktop_score, mobile_score)
+        cached = self._cache.get(key)
+        if cached is not None:
+            logger.info(f"♻️ Reusing cached AI insights for {url}")
+            return AIInsights(**cached)
+
+        try:
+            insights = await self._request_insights(url, overall_score, desktop_score, mobile_score)
+        except Exception:
+            logger.error("❌ AI failed", exc_info=True)
+            return self._fallback(overall_score)
+
+        self._cache.set(key, insights.model_dump())
+        return insights
+
+    async def stream_insights(
+        self,
+        url: str,
+        overall_score: float,
+        desktop_score: Optional[float],
+        mobile_score: Optional[float],
+    ) -> AsyncIterator[str]:
+        """
+        Yield the insights JSON text as the model produces it, so clients can
+        start rendering at the first token. A cached answer is sent in one piece.
+        """
+        desktop_score = round(desktop_score, 1) if desktop_score is not None else None
+        mobile_score = round(mobile_score, 1) if mobile_score is not None else None
+        overall_score = round(overall_score, 1)
+
+        key = self._cache_key(url, overall_score, desktop_score, mobile_score)
+        cached = self._cache.get(key)
+        if cached is not None:
+            yield orjson.dumps(cached).decode()
+            return
+
+        payload = self._payload(self._build_prompt(url, overall_score, desktop_score, mobile_score))
+        payload["stream"] = True
+
+        parts: List[str] = []
+        client = await get_client()
+        async with client.stream("POST", DEEPSEEK_API_URL, json=payload) as response:
+            response.raise_for_status()
+            # Server-sent events: "data: {chunk}" lines, terminated by "data: [DONE]"
+            async for line in response.aiter_lines():
+                if not line.startswith("data:"):
+                    continue
+                data = line[5:].strip()
+                if data == "[DONE]":
+                    break
+                delta = orjson.loads(data)["choices"][0].get("delta", {}).get("content")
+                if delta:
+                    parts.append(delta)
+                    yield delta
+
+        # Cache the completed answer so the regular path can reuse it
+        try:
+            insights = AIInsights(**self._extract_json("".join(parts)))
+        except Exception:
+            logger.warning(f"Streamed AI insights for {url} were not valid JSON; not caching")
+            return
+        self._cache.set(key, insights.model_dump())
+
+    def _cache_key(
+        self,
+        url: str,
+        score: float,
+        desktop_score: Optional[float],
+        mobile_score: Optional[float],
+    ) -> str:
+        return LLMCache.cache_key(
+            self.model,
+            url,
+            {"score": score, "desktop": desktop_score, "mobile": mobile_score},
+        )
+
+    async def _request_insights(
+        self,
+        url: str,
+        score: float,
+        desktop_score: Optional[float],
+        mobile_score: Optional[float],
+    ) -> AIInsights:
+        parsed = await self._complete(self._build_prompt(url, score, desktop_score, mobile_score))
+        return AIInsights(**parsed)
+
+    def _payload(self, prompt: str, max_tokens: int = 600) -> Dict[str, Any]:
+        return {
             "model": self.model,
             "messages": [
                 {
@@ -50,30 +194,32 @@ class GeminiAnalyzer:
                 },
                 {
                     "role": "user",
-                    "content": self._build_prompt(url, overall_score),
+                    "content": prompt,
                 },
             ],
             "temperature": 0.3,
+            # Strict JSON output, capped to keep tail latency down
+            "response_format": {"type": "json_object"},
+            "max_tokens": max_tokens,
         }
 
-        try:
-            client = await get_client()
-            async with client:
-                response = await client.post(DEEPSEEK_API_URL, json=payload)
-                response.raise_for_status()
+    async def _complete(self, prompt: str, max_tokens: int = 600) -> dict:
+        """Send one prompt and return the JSON object the model replied with."""
+        payload = self._payload(prompt, max_tokens)
 
-                data = response.json()
-                content = data["choices"][0]["message"]["content"].strip()
+        client = await get_client()
+        response = await client.post(DEEPSEEK_API_URL, json=payload)
+        response.raise_for_status()
 
-                parsed = self._extract_json(content)
-                return AIInsights(**parsed)
+        data = orjson.loads(response.content)
+        content = data["choices"][0]["message"]["content"].strip()
 
-        except Exception:
-            logger.error("❌ AI failed", exc_info=True)
-            return self._fallback(overall_score)
+        if len(content) > _THREADPOOL_PARSE_THRESHOLD:
+            return await run_in_threadpool(self._extract_json, content)
+        return self._extract_json(content)
 
     def _fallback(self, score: float) -> AIInsights:
-        return AIInsights(
+        return AIInsights.model_construct(
             summary=f"Website scored {score}/100. AI unavailable.",
             strengths=["Performance data collected"],
             weaknesses=["AI analysis failed"],
@@ -81,18 +227,144 @@ class GeminiAnalyzer:
             strategic_recommendations="Check AI configuration.",
         )
 
-    def _build_prompt(self, url: str, score: float) -> str:
-        return f"""
-Website URL: {url}
-Overall Score: {score}/100
+    def _build_prompt(
+        self,
+        url: str,
+        score: float,
+        desktop_score: Optional[float],
+        mobile_score: Optional[float],
+    ) -> str:
+        # Only the scalar scores are sent; fewer tokens means a faster, cheaper call
+        metrics = orjson.dumps(
+            {"url": url, "score": score, "desktop": desktop_score, "mobile": mobile_score}
+        ).decode()
 
-Return ONLY valid JSON in this format:
+        return _PROMPT_TEMPLATE.format_map({"metrics": metrics})
 
-{{
-  "summary": "...",
-  "strengths": ["..."],
-  "weaknesses": ["..."],
-  "quick_wins": ["..."],
-  "strategic_recommendations": "..."
-}}
-"""
+
+class BatchedGeminiAnalyzer(GeminiAnalyzer):
+    """
+    Micro-batching front for GeminiAnalyzer.
+    When requests are already queued behind the first one, the batch keeps
+    collecting for up to batch_wait_timeout (max_batch_size at most) and is
+    answered by one combined prompt, so a burst of analyses pays the LLM's fixed
+    per-call latency once. A lone request is sent immediately with the regular
+    single-site prompt. generate_insights keeps its signature.
+    """
+
+    def __init__(self, max_batch_size: int = 8, batch_wait_timeout: float = 0.1) -> None:
+        super().__init__()
+        self.max_batch_size = max_batch_size
+        self.batch_wait_timeout = batch_wait_timeout
+        self._queue: Optional["asyncio.Queue[Tuple[Dict[str, Any], asyncio.Future]]"] = None
+        self._flusher: Optional[asyncio.Task] = None
+        # Strong references so in-flight batch calls aren't garbage-collected
+        self._batches: Set[asyncio.Task] = set()
+
+    async def aclose(self) -> None:
+        if self._flusher is not None:
+            self._flusher.cancel()
+            self._flusher = None
+
+    async def _request_insights(
+        self,
+        url: str,
+        score: float,
+        desktop_score: Optional[float],
+        mobile_score: Optional[float],
+    ) -> AIInsights:
+        if self._flusher is None or self._flusher.done():
+            self._queue = asyncio.Queue()
+            self._flusher = asyncio.create_task(self._flush_loop())
+
+        future = asyncio.get_running_loop().create_future()
+        item = {"url": url, "score": score, "desktop": desktop_score, "mobile": mobile_score}
+        self._queue.put_nowait((item, future))
+        return await future
+
+    async def _flush_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+
+            # Let callers scheduled in the same loop iteration enqueue; if none
+            # did, send the lone request now rather than waiting out the window
+            await asyncio.sleep(0)
+
+            if not self._queue.empty():
+                deadline = loop.time() + self.batch_wait_timeout
+                while len(batch) < self.max_batch_size:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
+
+            task = asyncio.create_task(self._send_batch(batch))
+            self._batches.add(task)
+            task.add_done_callback(self._batches.discard)
+
+    async def _send_batch(self, batch: List[Tuple[Dict[str, Any], asyncio.Future]]) -> None:
+        # Callers that timed out meanwhile are dropped from the prompt
+        batch = [(item, future) for item, future in batch if not future.done()]
+        if not batch:
+            return
+
+        outcomes = await self._request_batch([item for item, _ in batch])
+
+        for (_, future), outcome in zip(batch, outcomes):
+            if future.done():
+                continue
+            if isinstance(outcome, BaseException):
+                future.set_exception(outcome)
+            else:
+                future.set_result(outcome)
+
+    async def _request_batch(self, items: List[Dict[str, Any]]) -> List[Any]:
+        """One insight (or the exception for it) per item, in order."""
+        if len(items) == 1:
+            item = items[0]
+            try:
+                return [
+                    await super()._request_insights(
+                        item["url"], item["score"], item["desktop"], item["mobile"]
+                    )
+                ]
+            except Exception as exc:
+                return [exc]
+
+        logger.info(f"🧺 Sending {len(items)} AI insight requests as one batch")
+        try:
+            parsed = await self._complete(
+                self._build_batch_prompt(items),
+                max_tokens=600 * len(items),
+            )
+        except Exception as exc:
+            return [exc] * len(items)
+
+        # Models sometimes echo ids as strings ("0"); normalize before matching
+        results: Dict[int, Dict[str, Any]] = {}
+        for entry in parsed.get("results", []) if isinstance(parsed, dict) else []:
+            try:
+                results[int(entry["id"])] = entry
+            except (KeyError, TypeError, ValueError):
+                continue
+
+        outcomes: List[Any] = []
+        for item_id in range(len(items)):
+            entry = results.get(item_id)
+            if entry is None:
+                outcomes.append(ValueError(f"AI batch response has no result for id {item_id}"))
+                continue
+            try:
+                outcomes.append(AIInsights(**{k: v for k, v in entry.items() if k != "id"}))
+            except Exception as exc:
+                outcomes.append(exc)
+        return outcomes
+
+    def _build_batch_prompt(self, items: List[Dict[str, Any]]) -> str:
+        sites = orjson.dumps([{"id": i, **item} for i, item in enumerate(items)]).decode()
+
+        return _BATCH_PROMPT_TEMPLATE.format_map({"sites": sites})
@@ -6,20 +6,44 @@ falls back to simulated metrics when API key is missing or API fails.
 
 import asyncio
 import httpx
-from typing import Optional
+import orjson
+from typing import Optional, Tuple
 
+from app.core.cache import SingleFlight, TTLCache
 from app.core.config import get_settings
+from app.core.http_client import build_transport
 from app.core.logging import get_logger
 from app.models.schemas import PerformanceMetrics, DeviceType
 
 logger = get_logger(__name__)
 settings = get_settings()
 
+# Partial response: only the score and the audits we read, instead of the full
+# Lighthouse report (often over 1 MB)
+_PAGESPEED_FIELDS = (
+    "lighthouseResult("
+    "categories/performance/score,"
+    "audits("
+    "first-contentful-paint/numericValue,"
+    "largest-contentful-paint/numericValue,"
+    "interactive/numericValue,"
+    "total-blocking-time/numericValue,"
+    "cumulative-layout-shift/numericValue,"
+    "speed-index/numericValue"
+    ")"
+    ")"
+)
+
 
 class PageSpeedService:
     def __init__(self) -> None:
         self.api_key = settings.pagespeed_api_key
         self.timeout = httpx.Timeout(settings.request_timeout)
+        self._client: Optional[httpx.AsyncClient] = None
+
+        # PageSpeed results change slowly; reuse them for a few minutes per (url, device)
+        self._cache: TTLCache[Tuple[str, str], PerformanceMetrics] = TTLCache(capacity=1024, ttl=300.0)
+        self._inflight: SingleFlight[Tuple[str, str], PerformanceMetrics] = SingleFlight()
 
         if not self.api_key:
             logger.warning("PAGESPEED_API_KEY not configured. Using simulated performance metrics.")
@@ -31,13 +55,42 @@ class PageSpeedService:
         """
 
         if self.api_key:
+            key = (url, device_type.value)
+            cached = self._cache.get(key)
+            if cached is not None:
+                logger.info(f"Using cached PageSpeed results for {url} ({device_type.value})")
+                return cached
+
             try:
-                return await self._analyze_with_pagespeed(url, device_type)
+                # Concurrent requests for the same (url, device) share one API call
+                metrics = await self._inflight.run(
+                    key, lambda: self._analyze_with_pagespeed(url, device_type)
+                )
+                self._cache.set(key, metrics)
+                return metrics
             except Exception as exc:
                 logger.error(f"PageSpeed API failed, falling back to simulation: {exc}")
 
         return await self._analyze_simulated(url, device_type)
 
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """
+        Pooled client for PageSpeed API calls and the simulated fallback,
+        so desktop and mobile runs reuse connections instead of opening one each.
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(60.0),
+                transport=build_transport(httpx.Limits(max_keepalive_connections=20)),
+            )
+        return self._client
+
     # ------------------------------------------------------------------
     # Real PageSpeed API
     # ------------------------------------------------------------------
@@ -51,14 +104,14 @@ class PageSpeedService:
             "key": self.api_key,
             "strategy": strategy,
             "category": ["performance"],
+            "fields": _PAGESPEED_FIELDS,
         }
 
         logger.info(f"Calling PageSpeed API for {url} ({strategy})")
 
-        async with httpx.AsyncClient(timeout=httpx.Timeout(60.0)) as client:
-            response = await client.get(pagespeed_url, params=params)
-            response.raise_for_status()
-            data = response.json()
+        response = await self.client.get(pagespeed_url, params=params)
+        response.raise_for_status()
+        data = orjson.loads(response.content)
 
         lighthouse = data.get("lighthouseResult", {})
         audits = lighthouse.get("audits", {})
@@ -96,8 +149,10 @@ class PageSpeedService:
         start_time = asyncio.get_event_loop().time()
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                await client.get(url)
+            # Headers are enough for a load-time estimate; GET only if HEAD is refused
+            response = await self.client.head(url, timeout=self.timeout, follow_redirects=True)
+            if response.status_code == 405:
+                await self.client.get(url, timeout=self.timeout, follow_redirects=True)
 
             load_time = asyncio.get_event_loop().time() - start_time
 
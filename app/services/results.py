@@ -0,0 +1,102 @@
+"""
+Analysis result storage.
+In-process TTL cache by default; Redis when REDIS_URL is configured so that
+results are shared between multiple workers.
+
+Results are serialized to JSON once when saved, so polling returns the
+stored bytes as-is instead of re-encoding the model on every request.
+"""
+
+from functools import lru_cache
+from typing import Optional
+
+from app.core.cache import TTLCache
+from app.core.config import get_settings
+from app.core.logging import get_logger
+from app.models.schemas import AnalysisResult
+
+logger = get_logger(__name__)
+
+_PENDING = b"PENDING"
+_MISSING = object()
+
+
+def _serialize(result: AnalysisResult) -> bytes:
+    return result.model_dump_json().encode()
+
+
+class InMemoryResultStore:
+    """
+    Per-process storage. Entries expire after result_ttl seconds,
+    or after 15 minutes without being polled.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        # None marks a pending analysis
+        self._cache: TTLCache[str, Optional[bytes]] = TTLCache(
+            capacity=10_000,
+            ttl=ttl,
+            tti=900.0,
+        )
+
+    async def mark_pending(self, analysis_id: str) -> None:
+        self._cache.set(analysis_id, None)
+
+    async def save(self, analysis_id: str, result: AnalysisResult) -> None:
+        self._cache.set(analysis_id, _serialize(result))
+
+    async def get(self, analysis_id: str) -> Optional[bytes]:
+        """
+        Return the result as JSON bytes, or None while the analysis is pending.
+        Raises KeyError for unknown or expired ids.
+        """
+        result = self._cache.get(analysis_id, _MISSING)
+        if result is _MISSING:
+            raise KeyError(analysis_id)
+        return result
+
+    async def close(self) -> None:
+        pass
+
+
+class RedisResultStore:
+    """
+    Shared storage for multi-worker deployments.
+    Results are stored as JSON under analysis:<id> with a TTL.
+    """
+
+    def __init__(self, url: str, ttl: float) -> None:
+        import redis.asyncio as redis
+
+        self._redis = redis.from_url(url)
+        self._ttl = int(ttl)
+
+    @staticmethod
+    def _key(analysis_id: str) -> str:
+        return f"analysis:{analysis_id}"
+
+    async def mark_pending(self, analysis_id: str) -> None:
+        await self._redis.set(self._key(analysis_id), _PENDING, ex=self._ttl)
+
+    async def save(self, analysis_id: str, result: AnalysisResult) -> None:
+        await self._redis.set(self._key(analysis_id), _serialize(result), ex=self._ttl)
+
+    async def get(self, analysis_id: str) -> Optional[bytes]:
+        raw = await self._redis.get(self._key(analysis_id))
+        if raw is None:
+            raise KeyError(analysis_id)
+        if raw == _PENDING:
+            return None
+        return raw
+
+    async def close(self) -> None:
+        await self._redis.aclose()
+
+
+@lru_cache
+def get_result_store() -> "InMemoryResultStore | RedisResultStore":
+    settings = get_settings()
+    if settings.redis_url:
+        logger.info("Storing analysis results in Redis")
+        return RedisResultStore(settings.redis_url, ttl=settings.result_ttl)
+    return InMemoryResultStore(ttl=settings.result_ttl)
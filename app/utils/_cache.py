@@ -0,0 +1,12 @@
+"""
+Cache keys for page analysis results.
+analyze_page is a pure function of (html, base_url), so its results are keyed
+on a digest of the HTML (see WebsiteAnalyzer._page_cache).
+"""
+
+import hashlib
+
+
+def html_digest(html: str) -> bytes:
+    # blake2b hashes at GB/s, so even a large page costs well under a millisecond
+    return hashlib.blake2b(html.encode("utf-8", "ignore"), digest_size=16).digest()
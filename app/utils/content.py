@@ -4,33 +4,42 @@ Pure, stateless functions including Flesch Reading Ease calculation.
 """
 
 import re
-from typing import Dict, List
-from urllib.parse import urljoin, urlparse
-
-from bs4 import BeautifulSoup
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, List, Optional
+from urllib.parse import urljoin, urlsplit
 
 from app.models.schemas import ContentAnalysis
+from app.utils.html import ParsedPage, parse_html
+
+_WORD_RE = re.compile(r"[a-zA-Z']+")
+_VOWEL_RUN_RE = re.compile(r"[aeiouy]+")
 
 
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
 
-def analyze_content(html: str, base_url: str) -> ContentAnalysis:
-    soup = BeautifulSoup(html, "html.parser")
+def analyze_content(html: str, base_url: str, page: Optional[ParsedPage] = None) -> ContentAnalysis:
+    if page is None:
+        page = parse_html(html)
 
-    text = _extract_visible_text(soup)
+    text = page.text
     words = _tokenize_words(text)
 
     word_count = len(words)
-    paragraph_count = len(soup.find_all("p"))
+    paragraph_count = page.paragraph_count
 
-    readability = _flesch_reading_ease(text)
-    heading_score = _heading_structure_score(soup)
+    readability = _flesch_reading_ease(text, words)
+    heading_score = _heading_structure_score(page)
 
-    internal_links, external_links, broken_links = _analyze_links(soup, base_url)
+    internal_links, external_links, broken_links = _analyze_links(page.link_hrefs, base_url)
     keyword_density = _keyword_density(words)
-    content_gaps = _detect_content_gaps(word_count, soup)
+    content_gaps = _detect_content_gaps(
+        word_count,
+        has_h2=bool(page.headings["h2"]),
+        has_list=page.has_list,
+    )
 
     return ContentAnalysis(
         word_count=word_count,
@@ -49,43 +58,31 @@ def analyze_content(html: str, base_url: str) -> ContentAnalysis:
 # Internals (pure helpers)
 # ---------------------------------------------------------------------------
 
-def _extract_visible_text(soup: BeautifulSoup) -> str:
-    for tag in soup(["script", "style", "noscript"]):
-        tag.extract()
-    return " ".join(soup.stripped_strings)
-
-
 def _tokenize_words(text: str) -> List[str]:
-    return re.findall(r"[a-zA-Z']+", text.lower())
+    # Lowercase the matches rather than copying the whole page text first
+    return [word.lower() for word in _WORD_RE.findall(text)]
 
 
 # ----------------------- Readability (Flesch) -------------------------------
 
-def _flesch_reading_ease(text: str) -> float:
-    sentences = max(1, len(re.findall(r"[.!?]", text)))
-    words = _tokenize_words(text)
-    syllables = sum(_count_syllables(word) for word in words)
-
+def _flesch_reading_ease(text: str, words: List[str]) -> float:
     if not words:
         return 0.0
 
+    # str.count scans in C without building a list of matches
+    sentences = max(1, text.count(".") + text.count("!") + text.count("?"))
+    syllables = sum(map(_count_syllables, words))
     words_count = len(words)
 
     # Flesch Reading Ease formula
     return 206.835 - 1.015 * (words_count / sentences) - 84.6 * (syllables / words_count)
 
 
+# Page vocabularies are small and repetitive, so most words are cache hits
+@lru_cache(maxsize=8192)
 def _count_syllables(word: str) -> int:
-    word = word.lower()
-    vowels = "aeiouy"
-    count = 0
-    prev_char_was_vowel = False
-
-    for char in word:
-        is_vowel = char in vowels
-        if is_vowel and not prev_char_was_vowel:
-            count += 1
-        prev_char_was_vowel = is_vowel
+    # Each run of consecutive vowels is one syllable; words arrive lowercased
+    count = len(_VOWEL_RUN_RE.findall(word))
 
     if word.endswith("e") and count > 1:
         count -= 1
@@ -95,10 +92,10 @@ def _count_syllables(word: str) -> int:
 
 # ----------------------- Structure & Links ----------------------------------
 
-def _heading_structure_score(soup: BeautifulSoup) -> float:
-    h1 = len(soup.find_all("h1"))
-    h2 = len(soup.find_all("h2"))
-    h3 = len(soup.find_all("h3"))
+def _heading_structure_score(page: ParsedPage) -> float:
+    h1 = len(page.headings["h1"])
+    h2 = len(page.headings["h2"])
+    h3 = len(page.headings["h3"])
 
     score = 100
     if h1 == 0:
@@ -115,59 +112,70 @@ def _heading_structure_score(soup: BeautifulSoup) -> float:
     return max(score, 0)
 
 
-def _analyze_links(soup: BeautifulSoup, base_url: str) -> tuple[int, int, int]:
+def _analyze_links(hrefs: List[str], base_url: str) -> tuple[int, int, int]:
     internal = 0
     external = 0
     broken = 0
 
-    base_domain = urlparse(base_url).netloc
+    # Parse the base once; most hrefs can be classified by prefix alone
+    base_domain = urlsplit(base_url).netloc
 
-    for a in soup.find_all("a", href=True):
-        href = a.get("href")
+    for href in hrefs:
+        href = href.strip()
         if href.startswith("#"):
             continue
 
-        full_url = urljoin(base_url, href)
-        parsed = urlparse(full_url)
-
-        if not parsed.scheme.startswith("http"):
+        if href.startswith(("https://", "http://", "//")):
+            if _is_on_host(href.split("//", 1)[1], base_domain):
+                internal += 1
+            else:
+                external += 1
+        elif href.startswith(("mailto:", "tel:", "javascript:")):
             broken += 1
-        elif parsed.netloc == base_domain:
-            internal += 1
+        elif ":" in href.split("/", 1)[0]:
+            # Another scheme or an unusual form; let urllib resolve it
+            parsed = urlsplit(urljoin(base_url, href))
+            if not parsed.scheme.startswith("http"):
+                broken += 1
+            elif parsed.netloc == base_domain:
+                internal += 1
+            else:
+                external += 1
         else:
-            external += 1
+            # Relative path or query string, resolved against the base
+            internal += 1
 
     return internal, external, broken
 
 
+def _is_on_host(rest: str, netloc: str) -> bool:
+    # rest is the URL after "//"; the host must end where the netloc does
+    return rest.startswith(netloc) and rest[len(netloc):len(netloc) + 1] in ("", "/", "?", "#")
+
+
 # ----------------------- Keywords & Gaps ------------------------------------
 
 def _keyword_density(words: List[str], top_n: int = 10) -> Dict[str, float]:
     if not words:
         return {}
 
-    freq: Dict[str, int] = {}
-    for word in words:
-        if len(word) <= 3:
-            continue
-        freq[word] = freq.get(word, 0) + 1
-
+    # most_common(n) selects the top entries with a heap instead of a full sort
+    counts = Counter(word for word in words if len(word) > 3)
     total = len(words)
-    sorted_words = sorted(freq.items(), key=lambda x: x[1], reverse=True)[:top_n]
 
-    return {word: round(count / total, 4) for word, count in sorted_words}
+    return {word: round(count / total, 4) for word, count in counts.most_common(top_n)}
 
 
-def _detect_content_gaps(word_count: int, soup: BeautifulSoup) -> List[str]:
+def _detect_content_gaps(word_count: int, has_h2: bool, has_list: bool) -> List[str]:
     gaps: List[str] = []
 
     if word_count < 300:
         gaps.append("Content length is low (<300 words)")
 
-    if not soup.find("h2"):
+    if not has_h2:
         gaps.append("No H2 subheadings found")
 
-    if not soup.find("ul") and not soup.find("ol"):
+    if not has_list:
         gaps.append("No bullet or numbered lists found")
 
     return gaps
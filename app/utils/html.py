@@ -0,0 +1,142 @@
+"""
+HTML parsing utilities.
+A page is parsed and walked once; the SEO and content analyzers read the
+extracted signals from the resulting ParsedPage instead of re-querying the tree.
+
+Uses selectolax (C Lexbor parser) when installed, BeautifulSoup otherwise.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from bs4 import BeautifulSoup, NavigableString, Tag
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    import lxml  # noqa: F401
+
+    # C tokenizer, several times faster than the pure-Python html.parser
+    _PARSER = "lxml"
+except ImportError:
+    _PARSER = "html.parser"
+
+_INVISIBLE_TAGS = frozenset({"script", "style", "noscript"})
+_HEADING_TAGS = ("h1", "h2", "h3")
+
+
+class ParsedPage:
+    """
+    Everything the analyzers read from a page, collected in one tree walk.
+    Holds plain values only, so the analyzers don't depend on the parser.
+    """
+
+    def __init__(self) -> None:
+        self.title: Optional[str] = None
+        self.meta: List[Dict[str, Any]] = []
+        self.canonical_href: Optional[str] = None
+        self.headings: Dict[str, List[str]] = {name: [] for name in _HEADING_TAGS}
+        self.image_alts: List[Optional[str]] = []
+        self.link_hrefs: List[str] = []
+        self.has_structured_data = False
+        self.paragraph_count = 0
+        self.has_list = False
+        self.text = ""
+
+
+def parse_html(html: str) -> ParsedPage:
+    """Parse raw HTML into the values the SEO and content analyzers need."""
+    if LexborHTMLParser is not None:
+        return _parse_with_lexbor(html)
+    return _parse_with_bs4(html)
+
+
+def _parse_with_lexbor(html: str) -> ParsedPage:
+    tree = LexborHTMLParser(html)
+    page = ParsedPage()
+
+    title = tree.css_first("title")
+    if title is not None:
+        page.title = title.text(strip=True) or None
+
+    # Valueless attributes come back as None; bs4 reports them as ""
+    page.meta = [
+        {key: value or "" for key, value in node.attributes.items()}
+        for node in tree.css("meta")
+    ]
+
+    for node in tree.css("link[rel]"):
+        if "canonical" in (node.attributes.get("rel") or "").split():
+            page.canonical_href = node.attributes.get("href") or None
+            break
+
+    for name in _HEADING_TAGS:
+        page.headings[name] = [node.text(strip=True) for node in tree.css(name)]
+
+    page.image_alts = [node.attributes.get("alt") for node in tree.css("img")]
+    page.link_hrefs = [node.attributes.get("href") or "" for node in tree.css("a[href]")]
+    page.has_structured_data = tree.css_first('script[type="application/ld+json"]') is not None
+    page.paragraph_count = len(tree.css("p"))
+    page.has_list = tree.css_first("ul, ol") is not None
+
+    # Drop non-visible subtrees last: the ld+json lookup above needs <script>.
+    # strip_tags rather than decomposing css() matches one by one, which would
+    # touch nodes already freed with an enclosing match (<noscript><style>).
+    tree.strip_tags(["script", "style", "noscript"])
+    if tree.root is not None:
+        page.text = tree.root.text(separator=" ", strip=True)
+
+    return page
+
+
+def _parse_with_bs4(html: str) -> ParsedPage:
+    # One pass over the tree rather than one find_all traversal per tag type
+    soup = BeautifulSoup(html, _PARSER)
+    page = ParsedPage()
+    seen_title = False
+    seen_canonical = False
+    text_parts: List[str] = []
+
+    for node in soup.descendants:
+        if type(node) is NavigableString:
+            if any(parent.name in _INVISIBLE_TAGS for parent in node.parents):
+                continue
+            text = node.strip()
+            if text:
+                text_parts.append(text)
+            continue
+
+        if not isinstance(node, Tag):
+            continue
+
+        name = node.name
+        if name in page.headings:
+            page.headings[name].append(node.get_text(strip=True))
+        elif name == "p":
+            page.paragraph_count += 1
+        elif name == "a":
+            href = node.get("href")
+            if href is not None:
+                page.link_hrefs.append(href)
+        elif name == "img":
+            page.image_alts.append(node.get("alt"))
+        elif name == "meta":
+            page.meta.append(node.attrs)
+        elif name == "link":
+            if not seen_canonical and "canonical" in (node.get("rel") or ()):
+                seen_canonical = True
+                page.canonical_href = node.get("href") or None
+        elif name == "title":
+            if not seen_title:
+                seen_title = True
+                page.title = node.string.strip() if node.string else None
+        elif name == "script":
+            if node.get("type") == "application/ld+json":
+                page.has_structured_data = True
+        elif name in ("ul", "ol"):
+            page.has_list = True
+
+    page.text = " ".join(text_parts)
+    return page
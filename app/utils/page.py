@@ -0,0 +1,17 @@
+"""
+Page-level analysis.
+Parses the HTML once and runs the SEO and content analyzers on the extracted page.
+Kept top-level and picklable so it can run in a worker process.
+"""
+
+from typing import Tuple
+
+from app.models.schemas import ContentAnalysis, SEOAnalysis
+from app.utils.content import analyze_content
+from app.utils.html import parse_html
+from app.utils.seo import analyze_seo
+
+
+def analyze_page(html: str, base_url: str) -> Tuple[SEOAnalysis, ContentAnalysis]:
+    page = parse_html(html)
+    return analyze_seo(html, base_url, page), analyze_content(html, base_url, page)
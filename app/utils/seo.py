@@ -3,30 +3,30 @@ SEO analysis utilities.
 Pure, stateless functions for extracting SEO signals from HTML content.
 """
 
-from typing import List, Dict
-from bs4 import BeautifulSoup
+from typing import Any, Dict, Optional
 from urllib.parse import urljoin
 
 from app.models.schemas import SEOAnalysis
-from typing import Optional
+from app.utils.html import ParsedPage, parse_html
 
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
 
-def analyze_seo(html: str, base_url: str) -> SEOAnalysis:
-    soup = BeautifulSoup(html, "html.parser")
+def analyze_seo(html: str, base_url: str, page: Optional[ParsedPage] = None) -> SEOAnalysis:
+    if page is None:
+        page = parse_html(html)
 
-    title = _get_title(soup)
-    meta_description = _get_meta_description(soup)
-    h1_tags = _get_headings(soup, "h1")
-    h2_tags = _get_headings(soup, "h2")
-    canonical_url = _get_canonical_url(soup, base_url)
-    meta_robots = _get_meta_robots(soup)
-    open_graph_tags = _get_open_graph_tags(soup)
-    structured_data = _has_structured_data(soup)
+    title = page.title
+    meta_description = _get_meta_description(page)
+    h1_tags = page.headings["h1"]
+    h2_tags = page.headings["h2"]
+    canonical_url = _get_canonical_url(page, base_url)
+    meta_robots = _get_meta_robots(page)
+    open_graph_tags = _get_open_graph_tags(page)
+    structured_data = page.has_structured_data
 
-    total_images, missing_alt = _analyze_image_alt_tags(soup)
+    total_images, missing_alt = _analyze_image_alt_tags(page)
 
     score = _calculate_seo_score(
         title=title,
@@ -58,49 +58,38 @@ def analyze_seo(html: str, base_url: str) -> SEOAnalysis:
 # Internals (pure helpers)
 # ---------------------------------------------------------------------------
 
-def _get_title(soup: BeautifulSoup) -> Optional[str]:
-    tag = soup.title
-    return tag.string.strip() if tag and tag.string else None
+def _find_meta(page: ParsedPage, name: str) -> Optional[Dict[str, Any]]:
+    return next((attrs for attrs in page.meta if attrs.get("name") == name), None)
 
 
-def _get_meta_description(soup: BeautifulSoup) -> Optional[str]:
-    tag = soup.find("meta", attrs={"name": "description"})
+def _get_meta_description(page: ParsedPage) -> Optional[str]:
+    tag = _find_meta(page, "description")
     return tag.get("content", "").strip() if tag else None
 
 
-def _get_headings(soup: BeautifulSoup, tag_name: str) -> List[str]:
-    return [tag.get_text(strip=True) for tag in soup.find_all(tag_name)]
-
-
-def _get_canonical_url(soup: BeautifulSoup, base_url: str) -> Optional[str]:
-    tag = soup.find("link", rel="canonical")
-    if tag and tag.get("href"):
-        return urljoin(base_url, tag["href"])
+def _get_canonical_url(page: ParsedPage, base_url: str) -> Optional[str]:
+    if page.canonical_href:
+        return urljoin(base_url, page.canonical_href)
     return None
 
 
-def _get_meta_robots(soup: BeautifulSoup) -> Optional[str]:
-    tag = soup.find("meta", attrs={"name": "robots"})
+def _get_meta_robots(page: ParsedPage) -> Optional[str]:
+    tag = _find_meta(page, "robots")
     return tag.get("content") if tag else None
 
 
-def _get_open_graph_tags(soup: BeautifulSoup) -> Dict[str, str]:
+def _get_open_graph_tags(page: ParsedPage) -> Dict[str, str]:
     og_tags: Dict[str, str] = {}
-    for tag in soup.find_all("meta"):
-        prop = tag.get("property")
+    for attrs in page.meta:
+        prop = attrs.get("property")
         if prop and prop.startswith("og:"):
-            og_tags[prop] = tag.get("content", "")
+            og_tags[prop] = attrs.get("content", "")
     return og_tags
 
 
-def _has_structured_data(soup: BeautifulSoup) -> bool:
-    return bool(soup.find("script", type="application/ld+json"))
-
-
-def _analyze_image_alt_tags(soup: BeautifulSoup) -> tuple[int, int]:
-    images = soup.find_all("img")
-    total = len(images)
-    missing = sum(1 for img in images if not img.get("alt"))
+def _analyze_image_alt_tags(page: ParsedPage) -> tuple[int, int]:
+    total = len(page.image_alts)
+    missing = sum(1 for alt in page.image_alts if not alt)
     return total, missing
 
 
@@ -0,0 +1,22 @@
+"""
+Gunicorn configuration for production deployments.
+Run with: gunicorn app.main:app -c gunicorn_conf.py
+
+Results are shared between workers only when REDIS_URL is set.
+"""
+
+import os
+
+_cpus = os.cpu_count() or 1
+
+bind = os.getenv("BIND", "0.0.0.0:8000")
+workers = int(os.getenv("WEB_CONCURRENCY", _cpus * 2 + 1))
+worker_class = "uvicorn.workers.UvicornWorker"
+keepalive = 30
+timeout = 120
+
+# Each worker owns a process pool for HTML analysis; split the cores between
+# them instead of giving every worker os.cpu_count() processes. An explicit
+# CPU_POOL_WORKERS (including 0, which analyzes on a thread) takes precedence.
+_cpu_pool_workers = os.getenv("CPU_POOL_WORKERS", str(max(1, _cpus // workers)))
+raw_env = [f"CPU_POOL_WORKERS={_cpu_pool_workers}"]
@@ -1,14 +1,14 @@
 """
 Debug script to test your exact Gemini API key configuration.
-Run: python debug_api_key.py
+Run: python scripts/debug_api_key.py
 """
 
 import os
 import sys
 from pathlib import Path
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent))
+# Add the project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
 
 def check_env_file():
@@ -110,18 +110,15 @@ def check_pydantic_settings():
         traceback.print_exc()
         return None
 
-def test_gemini_api(api_key: str):
+def check_gemini_api(api_key: str):
     print("\n" + "=" * 60)
     print("STEP 4: Testing Gemini API directly")
     print("=" * 60)
 
     from google import genai
-    import os
 
-    # 🔥 FORCE THE KEY (override any poisoned env var)
+    # Passed to the client directly; the process environment is left untouched
     clean_key = api_key.strip()
-    os.environ["GOOGLE_API_KEY"] = clean_key
-    os.environ["GEMINI_API_KEY"] = clean_key
 
     print(f"🔑 Testing with API key: {clean_key[:10]}...")
     print(f"🔎 Raw repr: {repr(clean_key)}")
@@ -155,10 +152,10 @@ def main():
     
     # Step 4: Test actual API if we have a key
     if settings_api_key:
-        test_gemini_api(settings_api_key)
+        check_gemini_api(settings_api_key)
     elif env_api_key:
         print("\n⚠️ API key found in environment but not in settings - configuration issue")
-        test_gemini_api(env_api_key)
+        check_gemini_api(env_api_key)
     else:
         print("\n❌ No API key found - cannot test Gemini API")
     
@@ -0,0 +1,22 @@
+"""
+Integration tests call real external APIs.
+They are skipped unless GEMINI_API_KEY is set, so a plain test run never spends API quota.
+"""
+
+import os
+
+import pytest
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "integration: calls real external APIs")
+
+
+def pytest_collection_modifyitems(config, items):
+    if os.getenv("GEMINI_API_KEY"):
+        return
+
+    skip = pytest.mark.skip(reason="GEMINI_API_KEY not set")
+    for item in items:
+        if "integration" in item.keywords:
+            item.add_marker(skip)
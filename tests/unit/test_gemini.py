@@ -0,0 +1,62 @@
+"""
+Micro-batching of AI insight requests.
+"""
+
+import asyncio
+
+from app.services.gemini import BatchedGeminiAnalyzer
+
+INSIGHTS = {
+    "summary": "ok",
+    "strengths": [],
+    "weaknesses": [],
+    "quick_wins": [],
+    "strategic_recommendations": "none",
+}
+
+
+def _run(analyzer, *urls):
+    async def go():
+        try:
+            return await asyncio.gather(
+                *(analyzer.generate_insights(url, None, None, 50.0) for url in urls)
+            )
+        finally:
+            await analyzer.aclose()
+
+    return asyncio.run(go())
+
+
+def test_concurrent_requests_share_one_call_and_accept_string_ids(monkeypatch):
+    prompts = []
+
+    async def complete(self, prompt, max_tokens=600):
+        prompts.append(prompt)
+        # ids echoed back as strings must still match
+        return {"results": [{"id": str(i), **INSIGHTS, "summary": f"site {i}"} for i in range(3)]}
+
+    monkeypatch.setattr(BatchedGeminiAnalyzer, "_complete", complete)
+
+    results = _run(BatchedGeminiAnalyzer(), "https://a.test", "https://b.test", "https://c.test")
+
+    assert len(prompts) == 1
+    assert [insights.summary for insights in results] == ["site 0", "site 1", "site 2"]
+
+
+def test_lone_request_is_not_held_for_the_batch_window(monkeypatch):
+    async def complete(self, prompt, max_tokens=600):
+        return INSIGHTS
+
+    monkeypatch.setattr(BatchedGeminiAnalyzer, "_complete", complete)
+    analyzer = BatchedGeminiAnalyzer(batch_wait_timeout=5.0)
+
+    async def go():
+        try:
+            return await asyncio.wait_for(
+                analyzer.generate_insights("https://a.test", None, None, 50.0),
+                timeout=1.0,
+            )
+        finally:
+            await analyzer.aclose()
+
+    assert asyncio.run(go()).summary == "ok"
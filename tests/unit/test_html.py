@@ -0,0 +1,71 @@
+"""
+Parser backends must extract the same signals from a page.
+"""
+
+import pytest
+
+from app.utils import html as html_utils
+
+pytest.importorskip("selectolax")
+
+PAGE = """<!DOCTYPE html>
+<html>
+<head>
+  <title> Example Domain </title>
+  <meta charset="utf-8">
+  <meta name="description" content="An example page for parser parity.">
+  <meta name="robots" content="index, follow">
+  <meta property="og:title" content="Example">
+  <link rel="stylesheet" href="/site.css">
+  <link rel="canonical" href="https://example.com/">
+  <script type="application/ld+json">{"@type": "WebSite"}</script>
+  <style>body { color: black; }</style>
+</head>
+<body>
+  <h1>Main heading</h1>
+  <h2>First section</h2>
+  <p>Some readable text. It has two sentences!</p>
+  <h2>Second section</h2>
+  <h3>Detail</h3>
+  <p>More text with a <a href="/about">relative link</a>
+     and an <a href="https://other.org/">external one</a>.</p>
+  <a href="#top">Back to top</a>
+  <img src="/a.png" alt="Diagram">
+  <img src="/b.png">
+  <ul><li>Item one</li><li>Item two</li></ul>
+  <script>var hidden = "script text";</script>
+  <noscript><style>.x { display: none; }</style>hidden fallback</noscript>
+</body>
+</html>
+"""
+
+
+def _signals(page: html_utils.ParsedPage) -> dict:
+    return {
+        "title": page.title,
+        "meta": page.meta,
+        "canonical_href": page.canonical_href,
+        "headings": page.headings,
+        "image_alts": page.image_alts,
+        "link_hrefs": page.link_hrefs,
+        "has_structured_data": page.has_structured_data,
+        "paragraph_count": page.paragraph_count,
+        "has_list": page.has_list,
+        # Whitespace between text nodes differs by backend; the words must not
+        "words": page.text.split(),
+    }
+
+
+def test_lexbor_and_bs4_extract_the_same_signals():
+    lexbor = html_utils._parse_with_lexbor(PAGE)
+    bs4 = html_utils._parse_with_bs4(PAGE)
+
+    assert _signals(lexbor) == _signals(bs4)
+
+
+def test_lexbor_drops_nested_invisible_content():
+    page = html_utils._parse_with_lexbor(PAGE)
+
+    assert "hidden" not in page.text
+    assert "color" not in page.text
+    assert "Main heading" in page.text
@@ -0,0 +1,23 @@
+"""
+PageSpeed request shape.
+"""
+
+from app.services.pagespeed import _PAGESPEED_FIELDS
+
+
+def test_fields_mask_selects_each_audit_value():
+    # Partial-response syntax: a /path can't follow a parenthesized selection,
+    # so every audit names its own numericValue
+    assert _PAGESPEED_FIELDS == (
+        "lighthouseResult("
+        "categories/performance/score,"
+        "audits("
+        "first-contentful-paint/numericValue,"
+        "largest-contentful-paint/numericValue,"
+        "interactive/numericValue,"
+        "total-blocking-time/numericValue,"
+        "cumulative-layout-shift/numericValue,"
+        "speed-index/numericValue"
+        "))"
+    )
+    assert ")/" not in _PAGESPEED_FIELDS
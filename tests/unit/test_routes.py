@@ -0,0 +1,24 @@
+"""
+Analysis request bookkeeping in the API routes.
+"""
+
+import asyncio
+
+import pytest
+
+from app.api import routes
+
+
+def test_failed_mark_pending_releases_inflight_key(monkeypatch):
+    async def unreachable_store(analysis_id):
+        raise ConnectionError("result store unreachable")
+
+    monkeypatch.setattr(routes.analysis_results, "mark_pending", unreachable_store)
+    payload = routes.AnalyzeRequest(url="https://example.com")
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(routes.analyze_website(payload))
+
+    # A retry must start a new analysis instead of getting the dead id back
+    assert (payload.url, payload.analyze_desktop, payload.analyze_mobile) not in routes._inflight
+    assert not routes._running_analyses